@@ -1,10 +1,92 @@
 import argparse
+import asyncio
+import csv
+import os
+import pathlib
+import posixpath
+import random
+import shutil
+import subprocess
+from collections import defaultdict
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+from typing import Container, Optional
 import rdflib
 from rdflib.namespace import RDF, RDFS, OWL
-from rdflib.term import BNode
+from rdflib.term import BNode, URIRef
+from rdflib.util import guess_format
+import mgclient
 from gqlalchemy import Memgraph
+import gqlalchemy.memgraph_constants as mg_consts
+
+try:
+    from pyoxigraph import NamedNode, RdfFormat, parse
+except ImportError:
+    parse = None  # type: ignore[assignment]
+
+# How many times a chunk rejected as a conflicting transaction is retried before it
+# is deferred. Every batch is a MERGE, so re-running a chunk is idempotent.
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.05  # seconds, the upper bound of the random delay, doubled after each attempt
+
+# A batch is a Cypher query template and the rows bound to its `$rows` parameter.
+Rows = list[dict[str, str]]
+Batch = tuple[str, Rows]
+
+# The predicates the import reads. Every other triple is dropped while parsing.
+PREDICATES = (RDF.type, RDFS.label, RDFS.subClassOf, RDFS.subPropertyOf, RDFS.domain, RDFS.range)
+
+# The rdf:types imported as Property nodes and the `type` each one gets. When a
+# property has several of these types, the first one listed here wins.
+PROPERTY_TYPES = {
+    str(OWL.ObjectProperty): 'ObjectProperty',
+    str(OWL.DatatypeProperty): 'DatatypeProperty',
+    str(RDF.Property): 'Property',
+}
+
+# Query templates for each kind of term. Every template UNWINDs a list of plain
+# row dicts bound to `$rows`, so the import sends one constant statement per kind
+# of term instead of formatting a Cypher string per triple.
+UNWIND_ROWS = "UNWIND $rows AS row "
+CLASS_QUERY = (
+    UNWIND_ROWS +
+    "MERGE (class:Class {uri: row.uri}) "
+    "ON CREATE SET class.label = row.label"
+)
+PROPERTY_QUERY = (
+    UNWIND_ROWS +
+    "MERGE (prop:Property {uri: row.uri}) "
+    "ON CREATE SET prop.label = row.label, prop.type = row.type"
+)
+
+def edge_query(child_label: str, parent_label: str, relationship: str) -> str:
+    """
+    Builds the query template linking `row.child` to `row.parent` with a relationship.
+
+    Args:
+        child_label (str): The node label of the relationship's start node.
+        parent_label (str): The node label of the relationship's end node.
+        relationship (str): The relationship type.
 
-def print_with_border(text):
+    Returns:
+        str: The Cypher query template.
+    """
+    return (
+        UNWIND_ROWS +
+        f"MATCH (child:{child_label} {{uri: row.child}}), (parent:{parent_label} {{uri: row.parent}}) "
+        f"MERGE (child)-[:{relationship}]->(parent)"
+    )
+
+# The relationships imported from the ontology: the predicate each one is read
+# from, the node labels of its start and end node, and its relationship type.
+EDGE_KINDS = (
+    (RDFS.subClassOf, "Class", "Class", "SUBCLASS"),
+    (RDFS.subPropertyOf, "Property", "Property", "SUBPROPERTY"),
+    (RDFS.domain, "Property", "Class", "DOMAIN"),
+    (RDFS.range, "Property", "Class", "RANGE"),
+)
+
+def print_with_border(text: str) -> None:
     """
     Prints the given text within a visually appealing box using UTF-8 box characters.
 
@@ -23,173 +105,537 @@ def print_with_border(text):
     print(bottom_border)
 
 
-def parse_ttl_to_cypher(ttl_file_path):
+def load_graph(rdf_file_path: str, is_ntriples: bool) -> rdflib.Graph:
     """
-    Parses a TTL (Turtle) file and generates Cypher queries to represent its content in a Memgraph database.
+    Loads an RDF file into an rdflib Graph, preferring rdflib's N-Triples parser.
+
+    rdflib's N-Triples parser is about twice as fast as its Turtle parser, so when
+    `rapper` is on the PATH a Turtle file is converted to N-Triples in memory first.
+    If `rapper` is missing or rejects the file, it is parsed as Turtle.
 
     Args:
-        ttl_file_path (str): The path to the Turtle file to be parsed.
+        rdf_file_path (str): The path to the Turtle or N-Triples file to be parsed.
+        is_ntriples (bool): Whether the file is already in N-Triples.
 
     Returns:
-        list: A list of Cypher queries as strings.
+        rdflib.Graph: The parsed graph.
     """
     g = rdflib.Graph()
-    g.parse(ttl_file_path, format="turtle")
-    create_queries = []
+    if is_ntriples:
+        g.parse(rdf_file_path, format="nt")
+        return g
 
-    # Extract and create queries for named classes, properties, and their relationships
-    create_queries.extend(process_named_classes(g))
-    create_queries.extend(process_class_hierarchies(g))
-    create_queries.extend(process_properties(g, OWL.ObjectProperty, 'ObjectProperty'))
-    create_queries.extend(process_properties(g, OWL.DatatypeProperty, 'DatatypeProperty'))
-    create_queries.extend(process_properties(g, RDF.Property, 'Property'))
-    create_queries.extend(process_property_hierarchies(g))
-    create_queries.extend(process_domain_and_range(g))
+    rapper = shutil.which("rapper")
+    if rapper is not None:
+        try:
+            converted = subprocess.run(
+                [rapper, "-q", "-i", "turtle", "-o", "ntriples", rdf_file_path],
+                capture_output=True, check=True,
+            )
+        except OSError as e:
+            print(f"Could not run rapper on {rdf_file_path}, parsing it as Turtle: {e}")
+        except subprocess.CalledProcessError as e:
+            # rapper's own error message says why it rejected the file
+            reason = e.stderr.decode(errors="replace").strip() if e.stderr else ""
+            print(f"Could not convert {rdf_file_path} with rapper, parsing it as Turtle: {reason or e}")
+        else:
+            g.parse(data=converted.stdout, format="nt")
+            return g
+
+    g.parse(rdf_file_path, format="turtle")
+    return g
+
+def read_triples(rdf_file_path: str) -> dict[URIRef, list[tuple[str, str]]]:
+    """
+    Reads the triples the import needs from an RDF file.
 
-    return create_queries
+    With pyoxigraph the file is parsed as a stream and only triples whose predicate is
+    one of `PREDICATES` are kept, so memory grows with the ontology's schema rather than
+    with the whole file. Without pyoxigraph the file is loaded into an rdflib Graph first
+    (see `load_graph`). Files ending in `.nt` are read as N-Triples.
 
-def process_named_classes(g):
-    """
-    Generates Cypher CREATE statements for named classes in the graph.
+    Triples whose subject is a blank node are skipped, and so are duplicate triples.
+    pyoxigraph terms are converted through a shared cache, so a URI that recurs across
+    predicates (as a class, a superclass, a domain, ...) is stored as a single str
+    object. The cache is keyed by the term itself rather than `id(term)`: equal terms
+    are often distinct objects, and pyoxigraph hands out fresh ones whose ids get reused.
 
     Args:
-        g (Graph): An rdflib Graph containing the RDF data.
+        rdf_file_path (str): The path to the Turtle or N-Triples file to be parsed.
 
     Returns:
-        list: A list of Cypher query strings for creating class nodes.
+        dict: The (subject, object) string pairs of each predicate in `PREDICATES`.
     """
-    queries = []
-    for class_type in [RDFS.Class, OWL.Class]:
-        for subject in g.subjects(RDF.type, class_type):
-            if isinstance(subject, BNode):  # Skip blank nodes
+    is_ntriples = guess_format(rdf_file_path) == "nt"
+    triples: dict[URIRef, list[tuple[str, str]]] = {predicate: [] for predicate in PREDICATES}
+
+    # These loops run once per triple, so globals, builtins and bound methods are
+    # looked up once here instead of on every iteration
+    _isinstance = isinstance
+
+    if parse is not None:
+        strings: dict[object, str] = {}
+        cached = strings.get
+        cache = strings.setdefault
+        _NamedNode = NamedNode
+        wanted = {NamedNode(predicate): pairs.append for predicate, pairs in triples.items()}.get
+        rdf_format = RdfFormat.N_TRIPLES if is_ntriples else RdfFormat.TURTLE
+        # Relative IRIs resolve against the file, as they do when rdflib parses it, and
+        # the lenient mode accepts IRIs with characters such as spaces, as rdflib does
+        base_iri = pathlib.Path(rdf_file_path).resolve().as_uri()
+        for triple in parse(path=rdf_file_path, format=rdf_format, base_iri=base_iri, lenient=True):
+            append = wanted(triple.predicate)
+            if append is None:
+                continue
+            subject = triple.subject
+            if not _isinstance(subject, _NamedNode):
+                continue
+            obj = triple.object
+            append((
+                cached(subject) or cache(subject, subject.value),
+                cached(obj) or cache(obj, obj.value),
+            ))
+        # The stream repeats triples stated more than once, which an rdflib Graph
+        # stores only once; drop them so both paths emit the same rows
+        return {predicate: list(dict.fromkeys(pairs)) for predicate, pairs in triples.items()}
+
+    # rdflib terms are str subclasses already, so a cache lookup (which goes through
+    # rdflib's Python-level __eq__) would cost more than the plain conversion
+    _BNode = BNode
+    _str = str
+    g = load_graph(rdf_file_path, is_ntriples)
+    for predicate, pairs in triples.items():
+        append = pairs.append
+        for subject, obj in g.subject_objects(predicate):
+            if _isinstance(subject, _BNode):
                 continue
-            label = g.value(subject, RDFS.label) or subject.split('/')[-1]
-            queries.append(f"CREATE (:Class {{uri: '{subject}', label: '{label}'}})")
-    return queries
+            append((_str(subject), _str(obj)))
+    return triples
 
-def process_class_hierarchies(g):
+def parse_ttl_to_cypher(ttl_file_path: str) -> list[Batch]:
     """
-    Generates Cypher MERGE statements for class hierarchies using rdfs:subClassOf.
+    Parses a TTL (Turtle) file and generates batched Cypher queries to represent its content in a Memgraph database.
+
+    Each batch is a parameterized query template that `UNWIND`s a list of rows, one
+    batch per kind of term. The rows are sent in chunks of at most `--batch-size`,
+    or written to CSV files and read by the server with `--load-csv`.
 
     Args:
-        g (Graph): An rdflib Graph containing the RDF data.
+        ttl_file_path (str): The path to the Turtle or N-Triples file to be parsed.
 
     Returns:
-        list: A list of Cypher query strings for creating subclass relationships.
+        list: A list of (query_template, rows) tuples.
     """
-    queries = []
-    for subclass, superclass in g.subject_objects(RDFS.subClassOf):
-        if isinstance(subclass, BNode) or isinstance(superclass, BNode):
-            continue
-        queries.append(
-            f"MATCH (child:Class {{uri: '{subclass}'}}), (parent:Class {{uri: '{superclass}'}}) "
-            f"MERGE (child)-[:SUBCLASS]->(parent)"
-        )
-    return queries
+    triples = read_triples(ttl_file_path)
+    batches: list[Batch] = []
+
+    # Bucket subjects by rdf:type and index labels once, so the processors below
+    # do dictionary lookups instead of repeated scans.
+    # Blank nodes never show up here and never become Class or Property nodes.
+    types: defaultdict[str, list[str]] = defaultdict(list)
+    for subject, rdf_type in triples[RDF.type]:
+        types[rdf_type].append(subject)
+
+    # A subject with several labels (e.g. one per language) keeps the first one
+    # read, rather than whichever one happens to be read last
+    labels: dict[str, str] = {}
+    for subject, label in triples[RDFS.label]:
+        labels.setdefault(subject, label)
+
+    # Resolve each property's type once from the buckets, instead of one pass
+    # per property type
+    prop_types: dict[str, str] = {}
+    for rdf_type, prop_type in PROPERTY_TYPES.items():
+        for prop in types[rdf_type]:
+            prop_types.setdefault(prop, prop_type)
+
+    # Classes typed both rdfs:Class and owl:Class are kept once, in first-seen order
+    classes = dict.fromkeys(chain(types[str(RDFS.Class)], types[str(OWL.Class)]))
+
+    # Extract and create batches for named classes and properties
+    batches.append(process_named_classes(classes, labels))
+    batches.append(process_properties(prop_types, labels))
+
+    # ... and for their relationships, one batch per kind of edge
+    nodes: dict[str, Container[str]] = {"Class": classes, "Property": prop_types}
+    for predicate, child_label, parent_label, relationship in EDGE_KINDS:
+        query = edge_query(child_label, parent_label, relationship)
+        batches.append(process_edges(triples[predicate], nodes[child_label], nodes[parent_label], query))
+
+    return batches
+
+def local_name(uri: str) -> str:
+    """
+    Returns the part of a URI after its last `#` or `/`, used as a fallback label.
+
+    A trailing `#` or `/` is stripped first, so `http://example.org/onto#` is
+    labelled `onto` rather than with an empty string.
+
+    Args:
+        uri (str): The URI of the class or property.
+
+    Returns:
+        str: The URI's local name, or the whole URI if it has none.
+    """
+    return uri.rstrip('#/').rsplit('#', 1)[-1].rsplit('/', 1)[-1] or uri
 
-def process_properties(g, rdf_type, prop_type):
+def process_named_classes(classes: dict[str, None], labels: dict[str, str]) -> Batch:
     """
-    Generates Cypher CREATE statements for properties of a specific RDF type.
+    Generates a batched Cypher MERGE statement for named classes in the graph.
 
     Args:
-        g (Graph): An rdflib Graph containing the RDF data.
-        rdf_type (URIRef): The RDF type of the property (e.g., OWL.ObjectProperty).
-        prop_type (str): The label for the property type in the Cypher query.
+        classes (dict): The URIs of the named classes, each listed once.
+        labels (dict): The rdfs:label of each labelled subject URI.
 
     Returns:
-        list: A list of Cypher query strings for creating property nodes.
+        tuple: A Cypher query template and the list of class rows it unwinds.
     """
-    queries = []
-    for prop in g.subjects(RDF.type, rdf_type):
-        if isinstance(prop, BNode):
-            continue
-        label = g.value(prop, RDFS.label) or prop.split('/')[-1]
-        queries.append(f"CREATE (:Property {{uri: '{prop}', label: '{label}', type: '{prop_type}'}})")
-    return queries
+    rows: Rows = []
+    append = rows.append
+    label_of = labels.get
+    for subject in classes:
+        label = label_of(subject) or local_name(subject)
+        append({"uri": subject, "label": label})
+    return CLASS_QUERY, rows
+
+def process_properties(prop_types: dict[str, str], labels: dict[str, str]) -> Batch:
+    """
+    Generates a batched Cypher MERGE statement for the properties in the graph.
+
+    Args:
+        prop_types (dict): The property type (e.g., 'ObjectProperty') of each property URI.
+        labels (dict): The rdfs:label of each labelled subject URI.
 
-def process_property_hierarchies(g):
+    Returns:
+        tuple: A Cypher query template and the list of property rows it unwinds.
+    """
+    rows: Rows = []
+    append = rows.append
+    label_of = labels.get
+    for prop, prop_type in prop_types.items():
+        label = label_of(prop) or local_name(prop)
+        append({"uri": prop, "label": label, "type": prop_type})
+    return PROPERTY_QUERY, rows
+
+def process_edges(
+    pairs: list[tuple[str, str]], children: Container[str], parents: Container[str], query: str
+) -> Batch:
     """
-    Generates Cypher MERGE statements for property hierarchies using rdfs:subPropertyOf.
+    Generates a batched Cypher MERGE statement for one kind of relationship.
+
+    Edges are only kept when both ends are created as nodes; these lookups also
+    reject blank-node endpoints, which the MATCH would not find anyway.
 
     Args:
-        g (Graph): An rdflib Graph containing the RDF data.
+        pairs (list): The (subject, object) pairs of the relationship's predicate.
+        children (Container): The URIs created as nodes with the start node's label.
+        parents (Container): The URIs created as nodes with the end node's label.
+        query (str): The query template built by `edge_query`.
 
     Returns:
-        list: A list of Cypher query strings for creating subproperty relationships.
+        tuple: The query template and the list of edge rows it unwinds.
     """
-    queries = []
-    for subprop, superprop in g.subject_objects(RDFS.subPropertyOf):
-        if isinstance(subprop, BNode) or isinstance(superprop, BNode):
-            continue
-        queries.append(
-            f"MATCH (child:Property {{uri: '{subprop}'}}), (parent:Property {{uri: '{superprop}'}}) "
-            f"MERGE (child)-[:SUBPROPERTY]->(parent)"
-        )
-    return queries
+    rows: Rows = [
+        {"child": child, "parent": parent}
+        for child, parent in pairs
+        if child in children and parent in parents
+    ]
+    return query, rows
+
+def create_indexes(db: Memgraph) -> None:
+    """
+    Ensures the `uri` indexes and uniqueness constraints used by the import exist.
+
+    The edge batches look up both endpoints by `uri`; without a label-property index
+    each of those lookups is a full label scan.
 
-def process_domain_and_range(g):
+    Args:
+        db (Memgraph): The Memgraph client to configure.
+    """
+    # Plain CREATE statements only add what is missing: unlike gqlalchemy's
+    # ensure_indexes/ensure_constraints they leave every other index and
+    # constraint in the database alone
+    for label in ("Class", "Property"):
+        db.execute(f"CREATE INDEX ON :{label}(uri);")
+        db.execute(f"CREATE CONSTRAINT ON (n:{label}) ASSERT n.uri IS UNIQUE;")
+
+def connect(host: str, port: int) -> mgclient.Connection:
     """
-    Generates Cypher MERGE statements for the domain and range of properties.
+    Opens an autocommit pymgclient connection for the bulk import.
+
+    The credentials and TLS setting are read from the same MG_USERNAME, MG_PASSWORD and
+    MG_ENCRYPT environment variables gqlalchemy's `Memgraph()` uses for the setup queries.
 
     Args:
-        g (Graph): An rdflib Graph containing the RDF data.
+        host (str): The Memgraph host.
+        port (int): The Memgraph Bolt port.
 
     Returns:
-        list: A list of Cypher query strings for linking properties with their domain and range classes.
+        mgclient.Connection: The open connection.
     """
-    queries = []
+    connection = mgclient.connect(
+        host=host,
+        port=port,
+        username=mg_consts.MG_USERNAME,
+        password=mg_consts.MG_PASSWORD,
+        sslmode=mgclient.MG_SSLMODE_REQUIRE if mg_consts.MG_ENCRYPTED else mgclient.MG_SSLMODE_DISABLE,
+    )
+    connection.autocommit = True
+    return connection
+
+def open_connections(host: str, port: int, workers: int) -> list[mgclient.Connection]:
+    """
+    Opens the pool of connections used by `execute_batches`.
 
-    for prop, domain in g.subject_objects(RDFS.domain):
-        if isinstance(prop, BNode) or isinstance(domain, BNode):
-            continue
-        queries.append(
-            f"MATCH (prop:Property {{uri: '{prop}'}}), (class:Class {{uri: '{domain}'}}) "
-            f"MERGE (prop)-[:DOMAIN]->(class)"
-        )
+    If any connection fails to open, the ones already opened are closed before the
+    error is raised.
+
+    Args:
+        host (str): The Memgraph host.
+        port (int): The Memgraph Bolt port.
+        workers (int): The number of connections to open.
 
-    for prop, range in g.subject_objects(RDFS.range):
-        if isinstance(prop, BNode) or isinstance(range, BNode):
+    Returns:
+        list: The open connections.
+    """
+    connections: list[mgclient.Connection] = []
+    try:
+        for _ in range(workers):
+            connections.append(connect(host, port))
+    except Exception:
+        for connection in connections:
+            connection.close()
+        raise
+    return connections
+
+def run_query(connection: mgclient.Connection, query: str, rows: Rows) -> None:
+    """
+    Runs a query with the given rows bound to `$rows` on a raw pymgclient connection.
+
+    Args:
+        connection (mgclient.Connection): An autocommit pymgclient connection.
+        query (str): The UNWIND query template to execute.
+        rows (list): The rows bound to `$rows`.
+    """
+    cursor = connection.cursor()
+    cursor.execute(query, {"rows": rows})
+    cursor.fetchall()
+
+def is_conflict(error: Exception) -> bool:
+    """
+    Tells whether Memgraph rejected a query because it conflicted with a concurrent one.
+
+    Args:
+        error (Exception): The error raised by the driver.
+
+    Returns:
+        bool: True for serialization errors, which succeed when the query is re-run.
+    """
+    return "conflicting transactions" in str(error)
+
+async def execute_chunk(
+    pool: "asyncio.Queue[mgclient.Connection]",
+    executor: ThreadPoolExecutor,
+    host: str,
+    port: int,
+    query: str,
+    rows: Rows,
+) -> Optional[Exception]:
+    """
+    Executes one chunk of a batch on a pooled connection, retrying on conflicts.
+
+    Concurrent chunks that touch the same nodes can be rejected by Memgraph as
+    conflicting transactions. Those attempts are retried after a random, growing
+    delay, so the chunks that lost do not collide again; any other error is
+    returned right away. A connection left in a bad state, e.g. by a dropped socket,
+    is replaced before the chunk runs on it.
+
+    Args:
+        pool (asyncio.Queue): Idle pymgclient connections, one per worker.
+        executor (ThreadPoolExecutor): Threads running the blocking driver calls.
+        host (str): The Memgraph host, used to reconnect.
+        port (int): The Memgraph Bolt port, used to reconnect.
+        query (str): The UNWIND query template to execute.
+        rows (list): The rows bound to `$rows` for this chunk.
+
+    Returns:
+        Exception: The last error if every attempt failed, otherwise None.
+    """
+    loop = asyncio.get_running_loop()
+    connection = await pool.get()
+    error = None
+    try:
+        for attempt in range(MAX_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(random.uniform(0, RETRY_BACKOFF * 2 ** attempt))
+            try:
+                if connection.status != mgclient.CONN_STATUS_READY:
+                    connection.close()
+                    connection = await loop.run_in_executor(executor, connect, host, port)
+                await loop.run_in_executor(executor, run_query, connection, query, rows)
+                return None
+            except Exception as e:
+                error = e
+                if not is_conflict(e):
+                    break
+        return error
+    finally:
+        pool.put_nowait(connection)
+
+def load_batches_from_csv(db: Memgraph, batches: list[Batch], csv_dir: str, server_dir: str) -> int:
+    """
+    Imports batched Cypher queries through CSV files and Memgraph's LOAD CSV clause.
+
+    Each batch's rows are written to a CSV file whose header matches the row keys, and
+    its query template is run with `LOAD CSV ... WITH HEADER AS row` in place of the
+    UNWIND, so Memgraph reads the rows from disk instead of receiving them over Bolt.
+
+    Args:
+        db (Memgraph): The Memgraph client used to run the LOAD CSV queries.
+        batches (list): (query_template, rows) tuples as returned by `parse_ttl_to_cypher`.
+        csv_dir (str): The local directory the CSV files are written to.
+        server_dir (str): The same directory as seen by the Memgraph server.
+
+    Returns:
+        int: The number of rows that were imported successfully.
+    """
+    os.makedirs(csv_dir, exist_ok=True)
+    successful_rows = 0
+    for index, (query, rows) in enumerate(batches):
+        if not rows:
             continue
-        queries.append(
-            f"MATCH (prop:Property {{uri: '{prop}'}}), (class:Class {{uri: '{range}'}}) "
-            f"MERGE (prop)-[:RANGE]->(class)"
+        file_name = f"batch{index}.csv"
+        with open(os.path.join(csv_dir, file_name), "w", newline="", encoding="utf-8") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+        if not query.startswith(UNWIND_ROWS):
+            raise ValueError(f"Query template does not start with `{UNWIND_ROWS}`: `{query}`")
+        # Escaped so the path stays a single Cypher string literal
+        server_path = posixpath.join(server_dir, file_name).replace("\\", "\\\\").replace('"', '\\"')
+        load_query = (
+            f'LOAD CSV FROM "{server_path}" WITH HEADER AS row '
+            + query[len(UNWIND_ROWS):]
         )
-    return queries
+        try:
+            db.execute(load_query)
+            successful_rows += len(rows)
+        except Exception as e:
+            print(f"Failed to run query: {e} : `{load_query}` ({len(rows)} rows)")
+    return successful_rows
+
+async def execute_batches(
+    batches: list[Batch], connections: list[mgclient.Connection], host: str, port: int, chunk_size: int
+) -> int:
+    """
+    Executes batched Cypher queries over a pool of concurrent Memgraph connections.
 
-def main():
+    Batches run one after another, so nodes exist before the edges that match them,
+    while the chunks of a single batch are executed concurrently. Chunks that still
+    conflict after their retries, typically edges MERGEd onto the same hub class, are
+    re-run one at a time once the rest of their batch is done. The bulk path talks
+    to Memgraph through pymgclient directly, skipping gqlalchemy's per-query wrapping
+    and result conversion.
+
+    Args:
+        batches (list): (query_template, rows) tuples as returned by `parse_ttl_to_cypher`.
+        connections (list): The connections from `open_connections`, i.e. one per chunk
+            in flight at once. They are all closed when the import is done.
+        host (str): The Memgraph host, used to reconnect.
+        port (int): The Memgraph Bolt port, used to reconnect.
+        chunk_size (int): The maximum number of rows sent with a single query.
+
+    Returns:
+        int: The number of rows that were imported successfully.
+    """
+    pool: "asyncio.Queue[mgclient.Connection]" = asyncio.Queue()
+    for connection in connections:
+        pool.put_nowait(connection)
+
+    successful_rows = 0
+    try:
+        with ThreadPoolExecutor(max_workers=len(connections)) as executor:
+            for query, rows in batches:
+                chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+                errors = await asyncio.gather(
+                    *(execute_chunk(pool, executor, host, port, query, chunk) for chunk in chunks)
+                )
+                for chunk, error in zip(chunks, errors):
+                    # Nothing else is writing now, so a deferred chunk cannot conflict again
+                    if error is not None and is_conflict(error):
+                        error = await execute_chunk(pool, executor, host, port, query, chunk)
+                    if error is None:
+                        successful_rows += len(chunk)
+                    else:
+                        print(f"Failed to run query: {error} : `{query}` ({len(chunk)} rows)")
+    finally:
+        # Every chunk has returned its connection by now, including replaced ones
+        while not pool.empty():
+            pool.get_nowait().close()
+    return successful_rows
+
+def main() -> None:
     """
     Main function to parse command line arguments and run the script.
     """
     parser = argparse.ArgumentParser(description='Convert TTL file to Cypher queries for Memgraph.')
     parser.add_argument('-f', '--file', help='TTL file path', required=True)
+    parser.add_argument('--host', default=mg_consts.MG_HOST,
+                        help='Memgraph host (default: $MG_HOST or 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=mg_consts.MG_PORT,
+                        help='Memgraph Bolt port (default: $MG_PORT or 7687)')
+    parser.add_argument('-w', '--workers', type=int, default=8,
+                        help='Number of concurrent Memgraph connections (default: 8)')
+    parser.add_argument('-b', '--batch-size', type=int, default=10_000,
+                        help='Maximum number of rows sent per query (default: 10000)')
+    parser.add_argument('--load-csv', metavar='DIR',
+                        help='Write the rows as CSV files to DIR and import them with LOAD CSV')
+    parser.add_argument('--csv-server-dir', metavar='DIR',
+                        help='Path of the --load-csv directory as seen by Memgraph (default: same path)')
     args = parser.parse_args()
+    # Checked before anything touches the database, which is wiped below
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.batch_size < 1:
+        parser.error('--batch-size must be at least 1')
 
     ttl_file_path = args.file
-    cypher_queries = parse_ttl_to_cypher(ttl_file_path)
+    batches = parse_ttl_to_cypher(ttl_file_path)
 
     # Initialize connection to Memgraph
+    connections: list[mgclient.Connection] = []
     try:
-        db = Memgraph()
+        db = Memgraph(host=args.host, port=args.port)
+        # The bulk connections are opened first, so a server refusing them is
+        # reported before anything is deleted
+        if not args.load_csv:
+            connections = open_connections(args.host, args.port, args.workers)
         # Clear the existing data in Memgraph
         db.execute("MATCH (n) DETACH DELETE n;")
+        create_indexes(db)
     except Exception as e:
-        print(f"Failed to connect to Memgraph or clear data: {e}")
+        for connection in connections:
+            connection.close()
+        print(f"Failed to connect to Memgraph or prepare the database: {e}")
         return
 
-    # Execute Cypher queries and track success
-    successful_creations = 0
-    for query in cypher_queries:
-        try:
-            db.execute(query)
-            successful_creations += 1
-        except Exception as e:
-            print(f"Failed to run query: {e} : `{query}`")
+    # Execute the batched Cypher queries and track success
+    total_rows = sum(len(rows) for _, rows in batches)
+    if args.load_csv:
+        server_dir = args.csv_server_dir or os.path.abspath(args.load_csv)
+        successful_rows = load_batches_from_csv(db, batches, args.load_csv, server_dir)
+    else:
+        successful_rows = asyncio.run(
+            execute_batches(batches, connections, args.host, args.port, args.batch_size)
+        )
 
     # Output summary with fancy ASCII border
     summary = f"Summary:\n"
-    summary += f"Total Cypher queries generated: {len(cypher_queries)}\n"
-    summary += f"Successfully executed queries: {successful_creations}\n"
-    summary += f"Failed queries: {len(cypher_queries) - successful_creations}"
+    summary += f"Total Cypher batches generated: {len(batches)}\n"
+    summary += f"Total rows generated: {total_rows}\n"
+    summary += f"Successfully imported rows: {successful_rows}\n"
+    summary += f"Failed rows: {total_rows - successful_rows}"
     print_with_border(summary)
 
 if __name__ == "__main__":
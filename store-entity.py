@@ -21,54 +21,68 @@ def fetch_data_model(url):
         return None
 
 
-def escape_quotes(s):
-    """Escape single quotes in a string."""
-    return s.replace("'", "\\'")
-
 def create_data_model(db, data_model):
     if not data_model:
         print("No data model provided.")
         return
 
-    # Escape single quotes in uri and description
-    uri_escaped = escape_quotes(data_model["uri"])
-    description_escaped = escape_quotes(data_model["description"])
-
-    # Create the DataModel node with escaped URI and description
-    model_query = f"""
-    CREATE (model:DataModel {{uri: '{uri_escaped}', description: '{description_escaped}'}})
-    RETURN id(model) AS modelId;
+    # Values are passed as query parameters, so no quoting or escaping is needed.
+    # Dimensions go first so the property query below can match them by name.
+    dimension_query = """
+    UNWIND $dimensions AS dimension
+    CREATE (:Dimension {name: dimension.name, description: dimension.description})
     """
-    model_result = db.execute_and_fetch(model_query)
-    model_id = next(model_result)["modelId"] if model_result else None
-
     dimensions = data_model.get("dimensions", {})
-    for dimension_name, dimension_description in dimensions.items():
-        # Escape single quotes in dimension description
-        dimension_description_escaped = escape_quotes(dimension_description)
-        dimension_query = f"""
-        CREATE (dimension:Dimension {{name: '{dimension_name}', description: '{dimension_description_escaped}'}})
-        """
-        db.execute(dimension_query)
+    dimension_params = {
+        "dimensions": [
+            {"name": dimension_name, "description": dimension_description}
+            for dimension_name, dimension_description in dimensions.items()
+        ],
+    }
 
-    for prop_name, prop_details in data_model["properties"].items():
-        # Escape single quotes in property details
-        prop_description_escaped = escape_quotes(prop_details["description"])
-        prop_query = f"""
-        MATCH (model:DataModel) WHERE id(model) = {model_id}
-        CREATE (prop:Property {{name: '{prop_name}', type: '{prop_details["type"]}', description: '{prop_description_escaped}'}})
-        WITH prop, model
-        CREATE (model)-[:HAS_PROPERTY]->(prop)
-        """
-        shape = prop_details.get("shape", [])
-        for dimension_name in shape:
-            prop_query += f"""
-            WITH prop
-            MATCH (dimension:Dimension {{name: '{dimension_name}'}})
-            CREATE (prop)-[:HAS_DIMENSION]->(dimension)
-            """
-        prop_query += "RETURN id(prop) AS propId;"
-        db.execute(prop_query)
+    # Create the DataModel node together with all its properties and their dimension links
+    model_query = """
+    CREATE (model:DataModel {uri: $uri, description: $description})
+    WITH model
+    UNWIND $properties AS property
+    CREATE (prop:Property {name: property.name, type: property.type, description: property.description})
+    CREATE (model)-[:HAS_PROPERTY]->(prop)
+    WITH prop, property
+    UNWIND property.shape AS dimension_name
+    MATCH (dimension:Dimension {name: dimension_name})
+    CREATE (prop)-[:HAS_DIMENSION]->(dimension)
+    """
+    model_params = {
+        "uri": data_model["uri"],
+        "description": data_model["description"],
+        "properties": [
+            {
+                "name": prop_name,
+                "type": prop_details["type"],
+                "description": prop_details["description"],
+                "shape": prop_details.get("shape", []),
+            }
+            for prop_name, prop_details in data_model["properties"].items()
+        ],
+    }
+
+    # Run both queries in one explicit transaction on a dedicated connection, so the
+    # data model is committed once and is either created completely or not at all
+    connection = db.new_connection()
+    try:
+        db.execute("BEGIN", connection=connection)
+        db.execute(dimension_query, dimension_params, connection=connection)
+        db.execute(model_query, model_params, connection=connection)
+        db.execute("COMMIT", connection=connection)
+    except Exception as e:
+        print(f"Failed to create data model: {e}")
+        # The rollback fails too if the connection itself was lost
+        try:
+            db.execute("ROLLBACK", connection=connection)
+        except Exception as rollback_error:
+            print(f"Failed to roll back the data model transaction: {rollback_error}")
+    finally:
+        connection._connection.close()
 
 url = "http://onto-ns.com/meta/0.1/Person"
 